@@ -2,36 +2,76 @@
 Shared test configuration and fixtures for Versionator MCP Server tests
 """
 
+import asyncio
 import json
 import os
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from pathlib import Path
 
 import aiohttp
+import orjson
 import pytest
 
+from versionator_mcp.core.http_client import HTTPClient
+
+# Environment flags, read once at session start
+_CI = os.environ.get("CI") == "true"
+_RUN_INTEGRATION = os.environ.get("VERSIONATOR_INTEGRATION") == "1"
+
 # Skip tests that hit GitHub API during CI to avoid rate limits
-skip_github_api = pytest.mark.skipif(
-    os.getenv("CI") == "true", reason="Skip GitHub API tests in CI to avoid rate limits"
-)
+skip_github_api = pytest.mark.skipif(_CI, reason="Skip GitHub API tests in CI to avoid rate limits")
+
+# Hand-written registry payloads modelled on the live APIs, trimmed to the fields read
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live-registry integration tests unless explicitly requested"""
+    if _RUN_INTEGRATION:
+        return
+
+    skip_integration = pytest.mark.skip(
+        reason="Live registry test (set VERSIONATOR_INTEGRATION=1 to run)"
+    )
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
 
 
 class MockResponse:
-    """Mock HTTP response for testing"""
+    """Mock HTTP response for testing
+
+    Instances are never mutated after construction, so one response can be
+    shared by every test in the session.
+    """
+
+    __slots__ = ("status", "headers", "_raw", "_text_data")
 
-    def __init__(self, status: int, json_data=None, text_data=None):
+    def __init__(self, status: int, json_data=None, text_data=None, headers=None):
         self.status = status
-        self._json_data = json_data
+        self.headers = headers or {}
+        # Encoded once up front, like a body received from the registry
+        self._raw = orjson.dumps(json_data) if json_data is not None else None
         self._text_data = text_data
 
     async def json(self):
-        if self._json_data is not None:
-            return self._json_data
+        if self._raw is not None:
+            return orjson.loads(self._raw)
         raise aiohttp.ContentTypeError("", "")
 
+    async def read(self):
+        if self._raw is not None:
+            return self._raw
+        return (self._text_data or "").encode()
+
     async def text(self):
         return self._text_data or ""
 
+    @property
+    def content(self):
+        if self._raw is not None:
+            return MockStreamReader(self._raw)
+        return MockStreamReader((self._text_data or "").encode())
+
     async def __aenter__(self):
         return self
 
@@ -39,15 +79,52 @@ class MockResponse:
         pass
 
 
+class GatedMockResponse(MockResponse):
+    """Mock response that holds its body until the gate is opened"""
+
+    __slots__ = ("gate",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.gate = asyncio.Event()
+
+    async def read(self):
+        await self.gate.wait()
+        return await super().read()
+
+
+class MockStreamReader:
+    """Mock of the aiohttp stream reader behind response.content"""
+
+    __slots__ = ("body",)
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def read(self, n: int = -1) -> bytes:
+        return self.body if n < 0 else self.body[:n]
+
+
 class MockSession:
     """Mock HTTP session for testing"""
 
+    __slots__ = ("response", "calls", "closed")
+
     def __init__(self, response: MockResponse):
         self.response = response
+        self.calls = 0
+        self.closed = False
 
     def get(self, url, **kwargs):
+        self.calls += 1
         return self.response
 
+    def head(self, url, **kwargs):
+        return self.get(url, **kwargs)
+
+    async def close(self):
+        self.closed = True
+
     async def __aenter__(self):
         return self
 
@@ -55,24 +132,114 @@ class MockSession:
         pass
 
 
+class MockRouter:
+    """Mock HTTP session serving canned responses registered per URL
+
+    Lets one test register every URL it needs up front instead of swapping
+    ``aiohttp.ClientSession`` once per request. Unregistered URLs fail loudly.
+    """
+
+    __slots__ = ("routes", "calls")
+
+    closed = False
+
+    def __init__(self):
+        self.routes: dict = {}
+        self.calls = 0
+
+    def add(self, url: str, status: int = 200, payload=None, body=None, headers=None):
+        self.routes[url] = MockResponse(status, json_data=payload, text_data=body, headers=headers)
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        if url not in self.routes:
+            raise AssertionError(f"Unexpected request to {url}")
+        return self.routes[url]
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+@pytest.fixture
+def mocked_aiohttp(monkeypatch):
+    """Route all registry requests in a test through a single MockRouter"""
+    router = MockRouter()
+    monkeypatch.setattr(aiohttp, "ClientSession", lambda *args, **kwargs: router)
+    return router
+
+
+@pytest.fixture(autouse=True)
+async def reset_shared_session():
+    """Drop the shared HTTP session and response cache so each test starts cold"""
+    yield
+    HTTPClient.clear_cache()
+    await HTTPClient.close_session()
+
+
 @pytest.fixture
+def restore_timeout():
+    """Snapshot the default request timeout and restore it after the test"""
+    timeout = HTTPClient._default_timeout
+    yield
+    HTTPClient._default_timeout = timeout
+
+
+@pytest.fixture(scope="session")
+def registry_payloads():
+    """Registry JSON payloads from tests/fixtures, keyed by registry name and loaded once"""
+    return {path.stem: json.loads(path.read_text()) for path in FIXTURES_DIR.glob("*.json")}
+
+
+# Shared responses for the common status codes
+MOCK_RESPONSE_200 = MockResponse(200, json_data={"version": "1.0.0"})
+MOCK_RESPONSE_404 = MockResponse(404, text_data="Not found")
+MOCK_RESPONSE_500 = MockResponse(500, text_data="Internal server error")
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Patch aiohttp.ClientSession for the test and return a setter for its response
+
+    ``mock_http(200, {"version": "1.0.0"})`` serves that payload to every request
+    until the next call; ``mock_http(404, text="Not found")`` serves an error.
+    """
+    session = MockSession(MOCK_RESPONSE_404)
+
+    def respond(status: int, json_data=None, text=None, headers=None) -> MockResponse:
+        session.response = MockResponse(
+            status, json_data=json_data, text_data=text, headers=headers
+        )
+        return session.response
+
+    monkeypatch.setattr(aiohttp, "ClientSession", lambda *args, **kwargs: session)
+    return respond
+
+
+@pytest.fixture(scope="session")
 def mock_response_200():
     """Fixture for successful HTTP response"""
-    return MockResponse(200, json_data={"version": "1.0.0"})
+    return MOCK_RESPONSE_200
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response_404():
     """Fixture for not found HTTP response"""
-    return MockResponse(404, text_data="Not found")
+    return MOCK_RESPONSE_404
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_response_500():
     """Fixture for server error HTTP response"""
-    return MockResponse(500, text_data="Internal server error")
+    return MOCK_RESPONSE_500
 
 
+# Sessions count their requests, so each test gets its own around the shared responses
 @pytest.fixture
 def mock_session_200(mock_response_200):
     """Fixture for successful HTTP session"""
@@ -2,12 +2,333 @@
 Tests for HTTP client functionality
 """
 
+import asyncio
+import gc
+import re
+import subprocess
+import sys
+from unittest.mock import patch
+
 import pytest
+from aiohttp import web
+
+from tests.conftest import GatedMockResponse, MockResponse, MockSession
+from tests.utils import get_latest_version, set_request_timeout
+from versionator_mcp.config import get_config
+from versionator_mcp.core import PackageNotFoundError, RegistryAPIError, get_registry
+from versionator_mcp.core.http_client import HTTPClient
+
+
+class RecordingMockSession(MockSession):
+    """Mock session that serves queued responses and records request headers"""
+
+    __slots__ = ("queue", "sent_headers")
+
+    def __init__(self, *responses: MockResponse):
+        super().__init__(responses[0])
+        self.queue = list(responses)
+        self.sent_headers: list = []
 
-from tests.utils import set_request_timeout
+    def get(self, url, **kwargs):
+        self.sent_headers.append(kwargs.get("headers") or {})
+        self.response = self.queue.pop(0)
+        return super().get(url, **kwargs)
 
 
-def test_set_request_timeout():
-    """Test setting request timeout"""
+def test_set_request_timeout(restore_timeout):
+    """Test setting request timeout applies to existing clients"""
     set_request_timeout(60)
-    # Test passes if no exception is raised
+    assert HTTPClient().timeout == 60
+    assert get_registry("npm").http_client.timeout == 60
+    assert HTTPClient(timeout=5).timeout == 5
+    assert get_registry("npm").http_client.client_timeout.total == 60
+    assert HTTPClient().client_timeout is HTTPClient().client_timeout
+
+
+@pytest.mark.parametrize("timeout", [0, -1])
+def test_set_request_timeout_rejects_non_positive(restore_timeout, timeout):
+    """Test that a non-positive timeout is rejected"""
+    with pytest.raises(ValueError, match="Invalid request timeout"):
+        set_request_timeout(timeout)
+
+
+def test_zero_timeout_from_environment_is_rejected(monkeypatch):
+    """Test a zero VERSIONATOR_REQUEST_TIMEOUT never becomes an unbounded timeout"""
+    monkeypatch.setenv("VERSIONATOR_REQUEST_TIMEOUT", "0")
+
+    with pytest.raises(ValueError, match="Invalid request timeout: 0"):
+        get_config()
+
+    # Importing the client leaves the environment to the server config
+    code = "from versionator_mcp.core import HTTPClient; print(HTTPClient().timeout)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "30"
+
+
+def test_set_cache_ttl(monkeypatch):
+    """Test the cache TTL can be set, including to zero, but not below it"""
+    monkeypatch.setattr(HTTPClient, "_cache_ttl", HTTPClient._cache_ttl)
+
+    HTTPClient.set_cache_ttl(0)
+    assert HTTPClient._cache_ttl == 0
+
+    with pytest.raises(ValueError, match="Invalid cache TTL"):
+        HTTPClient.set_cache_ttl(-1)
+    assert HTTPClient._cache_ttl == 0
+
+
+def test_current_timestamp_is_utc_iso():
+    """Test query timestamps are second-resolution UTC with a single Z suffix"""
+    timestamp = HTTPClient().get_current_timestamp()
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", timestamp)
+
+
+@pytest.mark.filterwarnings("error::ResourceWarning")
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_shared_session_across_event_loops():
+    """Test that lookups in successive asyncio.run() calls each get a working session
+
+    Each session is closed with the loop it belongs to, so no connector leaks.
+    """
+    sessions = []
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"version": "1.0.0"})
+
+    async def lookup() -> dict:
+        app = web.Application()
+        app.router.add_get("/pkg", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            sessions.append(await HTTPClient().get_session())
+            return await HTTPClient().get_json(f"http://127.0.0.1:{port}/pkg")
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(lookup()) == {"version": "1.0.0"}
+    assert asyncio.run(lookup()) == {"version": "1.0.0"}
+
+    assert sessions[0] is not sessions[1]
+    assert all(session.closed for session in sessions)
+    gc.collect()
+
+
+async def test_session_reuse_across_calls(mock_response_200):
+    """Test that sequential requests share a single client session"""
+    with patch("aiohttp.ClientSession", return_value=MockSession(mock_response_200)) as session:
+        for _ in range(5):
+            await get_latest_version("npm", "react")
+
+    assert session.call_count == 1
+
+
+async def test_set_session_is_used_for_requests(mock_session_200):
+    """Test that an injected session is shared instead of opening a new one"""
+    await HTTPClient.set_session(mock_session_200)
+
+    with patch("aiohttp.ClientSession") as session_class:
+        await get_latest_version("npm", "react")
+
+    assert session_class.call_count == 0
+    assert await HTTPClient().get_session() is mock_session_200
+
+
+async def test_close_session_resets_shared_session(monkeypatch, mock_session_200):
+    """Test that closing the shared session forces a new one on next use"""
+    monkeypatch.setattr(HTTPClient, "_cache_ttl", 0)
+    with patch("aiohttp.ClientSession", return_value=mock_session_200) as session:
+        await get_latest_version("npm", "react")
+        await HTTPClient.close_session()
+        await get_latest_version("npm", "react")
+
+    assert session.call_count == 2
+
+
+async def test_cache_hit_skips_network(mock_response_200):
+    """Test that a repeated lookup is served from the response cache"""
+    session = MockSession(mock_response_200)
+    await HTTPClient.set_session(session)
+
+    first = await get_latest_version("npm", "react")
+    second = await get_latest_version("npm", "react")
+
+    assert session.calls == 1
+    assert second.version == first.version
+
+
+async def test_cache_disabled_with_zero_ttl(monkeypatch, mock_response_200):
+    """Test that a TTL of zero sends every lookup to the registry"""
+    monkeypatch.setattr(HTTPClient, "_cache_ttl", 0)
+    session = MockSession(mock_response_200)
+    await HTTPClient.set_session(session)
+
+    await get_latest_version("npm", "react")
+    await get_latest_version("npm", "react")
+
+    assert session.calls == 2
+
+
+async def test_failed_lookup_not_cached(mock_response_404, mock_response_200):
+    """Test that errors are never cached"""
+    failing = MockSession(mock_response_404)
+    await HTTPClient.set_session(failing)
+    with pytest.raises(PackageNotFoundError, match="not found"):
+        await get_latest_version("npm", "react")
+
+    session = MockSession(mock_response_200)
+    await HTTPClient.set_session(session)
+    result = await get_latest_version("npm", "react")
+
+    assert failing.closed
+    assert session.calls == 1
+    assert result.version == "1.0.0"
+
+
+async def test_single_flight_dedupes(monkeypatch):
+    """Test that concurrent identical lookups share one request, even uncached"""
+    monkeypatch.setattr(HTTPClient, "_cache_ttl", 0)
+    response = GatedMockResponse(200, json_data={"version": "1.0.0"})
+    session = MockSession(response)
+    await HTTPClient.set_session(session)
+
+    lookups = asyncio.gather(*(get_latest_version("npm", "react") for _ in range(10)))
+    await asyncio.sleep(0)
+    response.gate.set()
+    results = await lookups
+
+    assert session.calls == 1
+    assert {result.version for result in results} == {"1.0.0"}
+
+
+async def test_single_flight_keeps_errors_per_package():
+    """Test that registries sharing a URL each get an error naming their own package"""
+    response = GatedMockResponse(404, text_data="Not found")
+    session = MockSession(response)
+    await HTTPClient.set_session(session)
+
+    lookups = asyncio.gather(
+        get_latest_version("go", "github.com/owner/repo"),
+        get_latest_version("swift", "owner/repo"),
+        return_exceptions=True,
+    )
+    await asyncio.sleep(0)
+    response.gate.set()
+    go_error, swift_error = await lookups
+
+    assert session.calls == 2
+    assert isinstance(go_error, PackageNotFoundError)
+    assert "'github.com/owner/repo'" in str(go_error)
+    assert isinstance(swift_error, PackageNotFoundError)
+    assert "'owner/repo'" in str(swift_error)
+
+
+async def test_host_limit_caps_concurrent_requests(monkeypatch):
+    """Test that requests to a rate-limited host beyond its cap wait for a slot"""
+    monkeypatch.setattr(HTTPClient, "_host_limits", {"api.github.com": 2})
+    monkeypatch.setattr(HTTPClient, "_host_semaphores", {})
+    response = GatedMockResponse(200, json_data={"tag_name": "1.0.0"})
+    session = MockSession(response)
+    await HTTPClient.set_session(session)
+
+    lookups = asyncio.gather(*(get_latest_version("swift", f"owner/repo{i}") for i in range(5)))
+    await asyncio.sleep(0.01)
+    assert session.calls == 2
+
+    response.gate.set()
+    results = await lookups
+
+    assert session.calls == 5
+    assert {result.version for result in results} == {"1.0.0"}
+
+
+async def test_transient_error_is_retried(monkeypatch):
+    """Test that a transient 5xx is retried and the lookup then succeeds"""
+    monkeypatch.setattr(HTTPClient, "_retry_backoff", 0)
+    session = RecordingMockSession(
+        MockResponse(503, text_data="Service unavailable"),
+        MockResponse(200, json_data={"version": "18.2.0"}),
+    )
+    await HTTPClient.set_session(session)
+
+    result = await get_latest_version("npm", "react")
+
+    assert session.calls == 2
+    assert result.version == "18.2.0"
+
+
+async def test_go_module_page_is_retried(monkeypatch):
+    """Test that the pkg.go.dev page check goes through the shared retry loop"""
+    monkeypatch.setattr(HTTPClient, "_retry_backoff", 0)
+    session = RecordingMockSession(
+        MockResponse(503, text_data="Service unavailable"), MockResponse(200)
+    )
+    await HTTPClient.set_session(session)
+
+    result = await get_latest_version("go", "golang.org/x/net")
+
+    assert session.calls == 2
+    assert result.registry_url == "https://pkg.go.dev/golang.org/x/net"
+
+
+async def test_long_retry_after_is_not_waited_for(restore_timeout):
+    """Test that a Retry-After beyond the request timeout fails without retrying"""
+    set_request_timeout(30)
+    session = MockSession(
+        MockResponse(429, text_data="Rate limited", headers={"Retry-After": "3600"})
+    )
+    await HTTPClient.set_session(session)
+
+    with pytest.raises(RegistryAPIError, match="npm API error 429"):
+        await get_latest_version("npm", "react")
+
+    assert session.calls == 1
+
+
+async def test_error_body_is_truncated(monkeypatch):
+    """Test that only the start of a large error page is read into the message"""
+    monkeypatch.setattr(HTTPClient, "_max_retries", 0)
+    await HTTPClient.set_session(MockSession(MockResponse(502, text_data="<html>" + "x" * 100_000)))
+
+    with pytest.raises(RegistryAPIError, match="npm API error 502: <html>x") as excinfo:
+        await get_latest_version("npm", "react")
+
+    assert len(str(excinfo.value)) < 2100
+
+
+async def test_conditional_get_returns_304_uses_cache():
+    """Test that a stale entry is revalidated with its ETag and reused on 304"""
+    url = "https://registry.npmjs.org/react/latest"
+    session = RecordingMockSession(
+        MockResponse(200, json_data={"version": "18.2.0"}, headers={"ETag": 'W/"abc"'}),
+        MockResponse(304, headers={"ETag": 'W/"abc"'}),
+    )
+    await HTTPClient.set_session(session)
+
+    first = await get_latest_version("npm", "react")
+
+    # Age the entry past its TTL so the next lookup has to revalidate
+    stored_at, etag, data = HTTPClient._cache[url]
+    HTTPClient._cache[url] = (stored_at - HTTPClient._cache_ttl, etag, data)
+
+    second = await get_latest_version("npm", "react")
+
+    assert session.calls == 2
+    assert "If-None-Match" not in session.sent_headers[0]
+    assert session.sent_headers[1]["If-None-Match"] == 'W/"abc"'
+    assert second.version == first.version == "18.2.0"
+
+
+async def test_warm_up_touches_each_origin(mock_response_500):
+    """Test that warm-up sends one request per origin and ignores failures"""
+    session = MockSession(mock_response_500)
+    await HTTPClient.set_session(session)
+
+    await HTTPClient().warm_up(["https://registry.npmjs.org/", "https://pypi.org/"])
+
+    assert session.calls == 2
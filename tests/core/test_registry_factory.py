@@ -2,74 +2,136 @@
 Tests for the registry factory and core functionality
 """
 
+import asyncio
+from types import MappingProxyType
+
+import aiohttp
 import pytest
 
-from tests.utils import get_latest_version, set_request_timeout
+from tests.conftest import GatedMockResponse, MockSession
+from tests.utils import get_latest_version, get_request_timeout, set_request_timeout
+from versionator_mcp.core import RegistryFactory, get_latest_versions, get_registry
+from versionator_mcp.models import PackageVersion
 
 
 class TestRegistryFactory:
     """Test the registry factory functionality"""
 
-    @pytest.mark.asyncio
-    async def test_get_latest_version_npm(self):
+    async def test_get_latest_version_npm(self, mocked_aiohttp, registry_payloads):
         """Test get_latest_version with npm registry"""
+        mocked_aiohttp.add(
+            "https://registry.npmjs.org/react/latest", payload=registry_payloads["npm"]
+        )
+
         result = await get_latest_version("npm", "react")
-        assert result.version is not None
+        assert result.version == "18.2.0"
         assert result.registry == "npm"
         assert "npmjs.org" in result.registry_url
 
-    @pytest.mark.asyncio
-    async def test_get_latest_version_aliases(self):
+    async def test_get_latest_version_aliases(self, mocked_aiohttp, registry_payloads):
         """Test get_latest_version with registry aliases"""
-        # Test npm alias
-        result = await get_latest_version("node", "react")
-        assert result.version is not None
-        assert result.registry == "npm"
+        mocked_aiohttp.add(
+            "https://registry.npmjs.org/react/latest", payload=registry_payloads["npm"]
+        )
+        mocked_aiohttp.add("https://pypi.org/pypi/requests/json", payload=registry_payloads["pypi"])
+
+        results = await get_latest_versions(
+            [("npm", "react"), ("node", "react"), ("pip", "requests"), ("python", "requests")]
+        )
+
+        expected = [("npm", "18.2.0"), ("npm", "18.2.0"), ("pypi", "2.28.1"), ("pypi", "2.28.1")]
+        for result, (expected_registry, expected_version) in zip(results, expected):
+            assert isinstance(result, PackageVersion)
+            assert result.registry == expected_registry
+            assert result.version == expected_version
+
+    async def test_get_latest_versions_parallel(self, monkeypatch):
+        """Test get_latest_versions runs lookups concurrently"""
+        requests = [("npm", "react"), ("node", "vue"), ("pypi", "django"), ("gem", "rails")]
+        response = GatedMockResponse(200, json_data={"version": "1.0.0"})
+        session = MockSession(response)
+        monkeypatch.setattr(aiohttp, "ClientSession", lambda *args, **kwargs: session)
+
+        lookups = asyncio.ensure_future(get_latest_versions(requests))
+
+        # Every request must reach the registry while the first is still unanswered
+        async def all_in_flight() -> None:
+            while session.calls < len(requests):
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(all_in_flight(), timeout=1)
+        response.gate.set()
+        results = await lookups
 
-        # Test pypi alias
-        result = await get_latest_version("python", "requests")
-        assert result.version is not None
-        assert result.registry == "pypi"
+        assert session.calls == len(requests)
+        assert [result.name for result in results] == ["react", "vue", "django", "rails"]
+
+    async def test_get_latest_versions_returns_exceptions(self, mock_http):
+        """Test get_latest_versions returns failures in place instead of raising"""
+        mock_http(200, {"version": "1.0.0"})
+
+        results = await get_latest_versions([("npm", "react"), ("invalid-registry", "pkg")])
+
+        assert isinstance(results[0], PackageVersion)
+        assert isinstance(results[1], ValueError)
+
+    def test_dispatch_table_is_frozen(self):
+        """Test the name/alias dispatch table is read-only and shares instances"""
+        assert isinstance(RegistryFactory()._dispatch, MappingProxyType)
+        assert get_registry("node") is get_registry("npm")
+        assert get_registry(" Python ") is get_registry("pypi")
 
-    @pytest.mark.asyncio
     async def test_get_latest_version_invalid_manager(self):
         """Test get_latest_version with invalid package manager"""
         with pytest.raises(ValueError, match="Unknown package manager 'invalid-registry'"):
             await get_latest_version("invalid-registry", "some-package")
 
-    @pytest.mark.asyncio
     async def test_get_latest_version_empty_manager(self):
         """Test get_latest_version with empty package manager"""
         with pytest.raises(ValueError, match="Unknown package manager"):
             await get_latest_version("", "package")
 
-    def test_set_request_timeout(self):
-        """Test setting request timeout"""
-        set_request_timeout(60)
-        # Test passes if no exception is raised
+    @pytest.mark.parametrize("timeout", [1, 30, 60, 3600])
+    def test_set_request_timeout(self, restore_timeout, timeout):
+        """Test setting request timeout round-trips"""
+        set_request_timeout(timeout)
+        assert get_request_timeout() == timeout
 
-    @pytest.mark.asyncio
-    async def test_get_latest_version_new_registries(self):
+    async def test_get_latest_version_new_registries(self, mocked_aiohttp, registry_payloads):
         """Test get_latest_version with newer registries"""
-        # Test crates.io
-        result = await get_latest_version("crates", "serde")
-        assert result.version is not None
-        assert result.registry == "crates"
-
-        # Test bioconda
-        result = await get_latest_version("bioconda", "samtools")
-        assert result.version is not None
-        assert result.registry == "bioconda"
-
-    @pytest.mark.asyncio
-    async def test_get_latest_version_v12_registries(self):
+        mocked_aiohttp.add(
+            "https://crates.io/api/v1/crates/serde", payload=registry_payloads["crates"]
+        )
+        mocked_aiohttp.add(
+            "https://api.anaconda.org/package/bioconda/samtools",
+            payload=registry_payloads["bioconda"],
+        )
+
+        results = await get_latest_versions([("crates", "serde"), ("bioconda", "samtools")])
+
+        expected = [("crates", "1.0.152"), ("bioconda", "1.21")]
+        for result, (expected_registry, expected_version) in zip(results, expected):
+            assert isinstance(result, PackageVersion)
+            assert result.registry == expected_registry
+            assert result.version == expected_version
+
+    async def test_get_latest_version_v12_registries(self, mocked_aiohttp, registry_payloads):
         """Test get_latest_version with v1.2.0 registries"""
-        # Test composer
-        result = await get_latest_version("composer", "symfony/console")
-        assert result.version is not None
-        assert result.registry == "composer"
-
-        # Test nuget
-        result = await get_latest_version("nuget", "Newtonsoft.Json")
-        assert result.version is not None
-        assert result.registry == "nuget"
+        mocked_aiohttp.add(
+            "https://packagist.org/packages/symfony/console.json",
+            payload=registry_payloads["composer"],
+        )
+        mocked_aiohttp.add(
+            "https://api.nuget.org/v3-flatcontainer/newtonsoft.json/index.json",
+            payload=registry_payloads["nuget"],
+        )
+
+        results = await get_latest_versions(
+            [("composer", "symfony/console"), ("nuget", "Newtonsoft.Json")]
+        )
+
+        expected = [("composer", "v7.1.5"), ("nuget", "13.0.3")]
+        for result, (expected_registry, expected_version) in zip(results, expected):
+            assert isinstance(result, PackageVersion)
+            assert result.registry == expected_registry
+            assert result.version == expected_version
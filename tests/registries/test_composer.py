@@ -1,32 +1,28 @@
 """
-Tests for Composer registry functionality
+Tests for Composer (Packagist) registry functionality
 """
 
-import pytest
-
-from tests.conftest import skip_github_api
 from tests.utils import get_composer_version
 
 
 class TestComposerRegistry:
-    """Test Composer registry functionality"""
+    """Test Composer (Packagist) registry functionality"""
+
+    async def test_get_composer_version_orders_semantically(self, mock_http):
+        """Test the latest release is chosen by version order, skipping branches and RCs"""
+        versions = {
+            version: {"description": "Console component"}
+            for version in ["dev-main", "v2.0.0-RC1", "v1.9.0", "v1.10.0", "1.x-dev"]
+        }
+        mock_http(200, {"package": {"versions": versions}})
 
-    @pytest.mark.asyncio
-    async def test_get_composer_version_success(self):
-        """Test successful Composer package version retrieval"""
         result = await get_composer_version("symfony/console")
-        assert result.version is not None
-        assert result.registry == "composer"
-        assert "packagist.org" in result.registry_url
+        assert result.version == "v1.10.0"
+        assert result.description == "Console component"
 
-    @pytest.mark.asyncio
-    async def test_get_composer_version_not_found(self):
-        """Test Composer package not found"""
-        with pytest.raises(Exception):
-            await get_composer_version("nonexistent")
+    async def test_get_composer_version_branches_only(self, mock_http):
+        """Test a package with only branch versions falls back to the first one"""
+        mock_http(200, {"package": {"versions": {"dev-main": {}, "dev-next": {}}}})
 
-    @pytest.mark.asyncio
-    async def test_get_composer_version_empty_name(self):
-        """Test Composer with empty package name"""
-        with pytest.raises(ValueError, match="Package name cannot be empty"):
-            await get_composer_version("")
+        result = await get_composer_version("acme/unreleased")
+        assert result.version == "dev-main"
@@ -2,30 +2,18 @@
 Tests for CRAN registry functionality
 """
 
-import pytest
-
 from tests.utils import get_cran_version
 
 
 class TestCRANRegistry:
     """Test CRAN registry functionality"""
 
-    @pytest.mark.asyncio
-    async def test_get_cran_version_success(self):
+    async def test_get_cran_version_success(self, mock_http, registry_payloads):
         """Test successful CRAN package version retrieval"""
+        mock_http(200, registry_payloads["cran"])
+
         result = await get_cran_version("ggplot2")
-        assert result.version is not None
+        assert result.version == "3.5.1"
         assert result.registry == "cran"
+        assert result.license == "MIT + file LICENSE"
         assert "crandb.r-pkg.org" in result.registry_url
-
-    @pytest.mark.asyncio
-    async def test_get_cran_version_not_found(self):
-        """Test CRAN package not found"""
-        with pytest.raises(Exception, match="Package 'nonexistent-r-package' not found"):
-            await get_cran_version("nonexistent-r-package")
-
-    @pytest.mark.asyncio
-    async def test_get_cran_version_empty_name(self):
-        """Test CRAN with empty package name"""
-        with pytest.raises(ValueError, match="Package name cannot be empty"):
-            await get_cran_version("")
@@ -0,0 +1,38 @@
+"""
+Live registry checks for the registries whose unit tests use canned responses
+
+These hit the real registry APIs and are skipped unless VERSIONATOR_INTEGRATION=1.
+"""
+
+import pytest
+
+from tests.conftest import skip_github_api
+from tests.utils import get_latest_version
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.parametrize(
+    "package_manager,package_name,url_fragment",
+    [
+        ("bioconda", "samtools", "anaconda.org"),
+        ("cpan", "DBI", "metacpan.org"),
+        ("cran", "ggplot2", "crandb.r-pkg.org"),
+        ("composer", "symfony/console", "packagist.org"),
+        ("dockerhub", "nginx", "hub.docker.com"),
+        ("homebrew", "wget", "formulae.brew.sh"),
+        ("maven", "org.springframework:spring-core", "search.maven.org"),
+        ("nuget", "Newtonsoft.Json", "nuget.org"),
+        ("terraform", "hashicorp/aws", "registry.terraform.io"),
+        pytest.param("go", "github.com/gin-gonic/gin", "github.com", marks=skip_github_api),
+        pytest.param("nextflow", "nf-core/rnaseq", "github.com", marks=skip_github_api),
+        pytest.param("nf-core-module", "fastqc", "github.com", marks=skip_github_api),
+        pytest.param("swift", "Alamofire/Alamofire", "github.com", marks=skip_github_api),
+    ],
+)
+async def test_live_latest_version(package_manager, package_name, url_fragment):
+    """Test the latest version is retrieved from the live registry"""
+    result = await get_latest_version(package_manager, package_name)
+    assert result.version is not None
+    assert result.registry == package_manager
+    assert url_fragment in result.registry_url
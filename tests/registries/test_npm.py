@@ -2,49 +2,50 @@
 Tests for npm registry
 """
 
-from unittest.mock import patch
-
 import pytest
 
-from tests.conftest import MockResponse, MockSession
 from tests.utils import get_npm_version
+from versionator_mcp.core import PackageNotFoundError, RegistryAPIError
+from versionator_mcp.core.http_client import HTTPClient
 
 
-@pytest.mark.asyncio
-async def test_get_npm_version_success():
+async def test_get_npm_version_success(mocked_aiohttp, registry_payloads):
     """Test successful npm version retrieval"""
-    mock_data = {
-        "version": "18.2.0",
-        "description": "React is a JavaScript library",
-        "homepage": "https://react.dev/",
-        "license": "MIT",
-    }
+    mocked_aiohttp.add("https://registry.npmjs.org/react/latest", payload=registry_payloads["npm"])
 
-    mock_response = MockResponse(200, mock_data)
+    result = await get_npm_version("react")
 
-    with patch("aiohttp.ClientSession", return_value=MockSession(mock_response)):
-        result = await get_npm_version("react")
+    assert result.name == "react"
+    assert result.version == "18.2.0"
+    assert result.registry == "npm"
+    assert result.description == "React is a JavaScript library"
+    assert result.homepage == "https://react.dev/"
+    assert result.license == "MIT"
+    assert "registry.npmjs.org" in result.registry_url
 
-        assert result.name == "react"
-        assert result.version == "18.2.0"
-        assert result.registry == "npm"
-        assert result.description == "React is a JavaScript library"
-        assert result.homepage == "https://react.dev/"
-        assert result.license == "MIT"
-        assert "registry.npmjs.org" in result.registry_url
 
+async def test_get_npm_version_scoped_name(mocked_aiohttp, registry_payloads):
+    """Test a scoped name is requested as one path segment with its slash encoded"""
+    mocked_aiohttp.add(
+        "https://registry.npmjs.org/@types%2Fnode/latest", payload=registry_payloads["npm"]
+    )
 
-@pytest.mark.asyncio
-async def test_get_npm_version_not_found():
-    """Test npm package not found"""
-    mock_response = MockResponse(404, text_data="Not found")
+    result = await get_npm_version("@types/node")
+
+    # The router only answers the exact URL registered above
+    assert mocked_aiohttp.calls == 1
+    assert result.name == "@types/node"
 
-    with patch("aiohttp.ClientSession", return_value=MockSession(mock_response)):
-        with pytest.raises(Exception, match="Package 'nonexistent' not found in npm registry"):
-            await get_npm_version("nonexistent")
+
+async def test_get_npm_version_not_found(mock_http):
+    """Test npm package not found"""
+    mock_http(404, text="Not found")
+    with pytest.raises(
+        PackageNotFoundError, match="Package 'nonexistent' not found in npm registry"
+    ):
+        await get_npm_version("nonexistent")
 
 
-@pytest.mark.asyncio
 async def test_get_npm_version_empty_name():
     """Test npm with empty package name"""
     with pytest.raises(ValueError, match="Package name cannot be empty"):
@@ -54,11 +55,9 @@ async def test_get_npm_version_empty_name():
         await get_npm_version("   ")
 
 
-@pytest.mark.asyncio
-async def test_get_npm_version_api_error():
-    """Test npm API error handling"""
-    mock_response = MockResponse(500, text_data="Internal server error")
-
-    with patch("aiohttp.ClientSession", return_value=MockSession(mock_response)):
-        with pytest.raises(Exception, match="npm API error 500: Internal server error"):
-            await get_npm_version("react")
+async def test_get_npm_version_api_error(monkeypatch, mock_http):
+    """Test npm API error handling once retries are exhausted"""
+    monkeypatch.setattr(HTTPClient, "_retry_backoff", 0)
+    mock_http(500, text="Internal server error")
+    with pytest.raises(RegistryAPIError, match="npm API error 500: Internal server error"):
+        await get_npm_version("react")
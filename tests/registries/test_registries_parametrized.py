@@ -0,0 +1,221 @@
+"""
+Parametrized tests for registries that share the success/not-found/empty-name scenarios
+"""
+
+import pytest
+
+import tests.utils
+from versionator_mcp.core import PackageNotFoundError
+
+
+def get_version_fn(registry_name: str):
+    """Resolve the tests.utils compatibility function for a registry"""
+    return getattr(tests.utils, f"get_{registry_name}_version")
+
+
+# (registry_name, test_package, expected_registry, url_fragment, expected_version)
+# Each registry is served its payload from tests/fixtures; live checks are in test_live_registries.
+SUCCESS_CASES = [
+    pytest.param(
+        "composer", "symfony/console", "composer", "packagist.org", "v7.1.5", id="composer"
+    ),
+    pytest.param("cpan", "DBI", "cpan", "metacpan.org", "1.643", id="cpan"),
+    pytest.param("dockerhub", "nginx", "dockerhub", "hub.docker.com", "latest", id="dockerhub"),
+    pytest.param("homebrew", "wget", "homebrew", "formulae.brew.sh", "1.24.5", id="homebrew"),
+    pytest.param(
+        "maven",
+        "org.springframework:spring-core",
+        "maven",
+        "search.maven.org",
+        "6.1.13",
+        id="maven",
+    ),
+    pytest.param("nuget", "Newtonsoft.Json", "nuget", "nuget.org", "13.0.3", id="nuget"),
+    pytest.param("go", "github.com/gin-gonic/gin", "go", "github.com", "v1.10.0", id="go"),
+    pytest.param("nextflow", "nf-core/rnaseq", "nextflow", "github.com", "3.14.0", id="nextflow"),
+    pytest.param("nfcore", "fastqc", "nf-core-module", "github.com", "3f5420a", id="nfcore"),
+    pytest.param("swift", "Alamofire/Alamofire", "swift", "github.com", "5.9.1", id="swift"),
+    pytest.param(
+        "terraform", "hashicorp/aws", "terraform", "registry.terraform.io", "5.31.0", id="terraform"
+    ),
+]
+
+# (registry_name, test_package, expected_exception, match, mock_response)
+# mock_response is the (status, json_data) served to the lookup, or None when the
+# name is rejected before any request is made.
+NOT_FOUND_CASES = [
+    pytest.param(
+        "bioconda",
+        "nonexistent-bio-package",
+        PackageNotFoundError,
+        "Package 'nonexistent-bio-package' not found in Bioconda registry",
+        (404, None),
+        id="bioconda",
+    ),
+    pytest.param(
+        "composer",
+        "nonexistent",
+        PackageNotFoundError,
+        "Package 'nonexistent' not found in Packagist registry",
+        (404, None),
+        id="composer",
+    ),
+    pytest.param(
+        "cpan",
+        "nonexistent",
+        PackageNotFoundError,
+        "Package 'nonexistent' not found in CPAN registry",
+        (404, None),
+        id="cpan",
+    ),
+    pytest.param(
+        "cran",
+        "nonexistent-r-package",
+        PackageNotFoundError,
+        "Package 'nonexistent-r-package' not found in CRAN registry",
+        (404, None),
+        id="cran",
+    ),
+    pytest.param(
+        "crates",
+        "nonexistent-crate-12345",
+        PackageNotFoundError,
+        "Package 'nonexistent-crate-12345' not found in crates.io registry",
+        (404, None),
+        id="crates",
+    ),
+    pytest.param(
+        "dockerhub",
+        "nonexistent",
+        PackageNotFoundError,
+        "Package 'nonexistent' not found in DockerHub registry",
+        (404, None),
+        id="dockerhub",
+    ),
+    pytest.param(
+        "homebrew",
+        "nonexistent",
+        PackageNotFoundError,
+        "Package 'nonexistent' not found in Homebrew registry",
+        (404, None),
+        id="homebrew",
+    ),
+    pytest.param(
+        "maven",
+        "nonexistent",
+        ValueError,
+        "Maven artifact name must be in 'groupId:artifactId' format",
+        None,
+        id="maven",
+    ),
+    pytest.param(
+        "swift",
+        "nonexistent",
+        ValueError,
+        "Swift package name must be in 'owner/repo' format",
+        None,
+        id="swift",
+    ),
+    pytest.param(
+        "nuget",
+        "nonexistent",
+        PackageNotFoundError,
+        "Package 'nonexistent' not found in NuGet registry",
+        (404, None),
+        id="nuget",
+    ),
+    pytest.param(
+        "go",
+        "nonexistent",
+        PackageNotFoundError,
+        "Module 'nonexistent' not found in Go module registry",
+        (404, None),
+        id="go",
+    ),
+    pytest.param(
+        "nextflow",
+        "nonexistent",
+        PackageNotFoundError,
+        "Package 'nonexistent' not found in GitHub registry",
+        (404, None),
+        id="nextflow",
+    ),
+    # GitHub answers a commits query for an unknown path with an empty list
+    pytest.param(
+        "nfcore",
+        "nonexistent",
+        PackageNotFoundError,
+        "Module 'nonexistent' not found in nf-core/modules",
+        (200, []),
+        id="nfcore",
+    ),
+    pytest.param(
+        "terraform",
+        "nonexistent/provider",
+        PackageNotFoundError,
+        "Package 'nonexistent/provider' not found in Terraform Registry registry",
+        (404, None),
+        id="terraform",
+    ),
+]
+
+EMPTY_NAME_CASES = [
+    "bioconda",
+    "composer",
+    "cpan",
+    "cran",
+    "crates",
+    "dockerhub",
+    "go",
+    "homebrew",
+    "maven",
+    "nextflow",
+    "nfcore",
+    "nuget",
+    "swift",
+    "terraform",
+]
+
+
+@pytest.mark.parametrize(
+    "registry_name,test_package,expected_registry,url_fragment,expected_version", SUCCESS_CASES
+)
+async def test_success(
+    mock_http,
+    registry_payloads,
+    registry_name,
+    test_package,
+    expected_registry,
+    url_fragment,
+    expected_version,
+):
+    """Test successful package version retrieval"""
+    mock_http(200, registry_payloads[registry_name])
+
+    result = await get_version_fn(registry_name)(test_package)
+
+    assert result.version == expected_version
+    assert result.registry == expected_registry
+    assert url_fragment in result.registry_url
+
+
+@pytest.mark.parametrize(
+    "registry_name,test_package,expected_exception,match,mock_response", NOT_FOUND_CASES
+)
+async def test_not_found(
+    mock_http, registry_name, test_package, expected_exception, match, mock_response
+):
+    """Test package not found or rejected before querying the registry"""
+    if mock_response is not None:
+        status, json_data = mock_response
+        mock_http(status, json_data, text="Not found")
+
+    with pytest.raises(expected_exception, match=match):
+        await get_version_fn(registry_name)(test_package)
+
+
+@pytest.mark.parametrize("registry_name", EMPTY_NAME_CASES)
+async def test_empty_name(registry_name):
+    """Test registries reject an empty package name"""
+    with pytest.raises(ValueError, match="Package name cannot be empty"):
+        await get_version_fn(registry_name)("")
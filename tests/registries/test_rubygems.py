@@ -2,34 +2,28 @@
 Tests for RubyGems registry
 """
 
-from unittest.mock import patch
-
 import pytest
 
-from tests.conftest import MockResponse, MockSession
 from tests.utils import get_rubygems_version
+from versionator_mcp.core import PackageNotFoundError
 
 
-@pytest.mark.asyncio
-async def test_get_rubygems_version_success():
+async def test_get_rubygems_version_success(mock_http, registry_payloads):
     """Test successful RubyGems version retrieval"""
-    mock_data = {"version": "7.0.4"}
-    mock_response = MockResponse(200, mock_data)
+    mock_http(200, registry_payloads["rubygems"])
 
-    with patch("aiohttp.ClientSession", return_value=MockSession(mock_response)):
-        result = await get_rubygems_version("rails")
+    result = await get_rubygems_version("rails")
 
-        assert result.name == "rails"
-        assert result.version == "7.0.4"
-        assert result.registry == "rubygems"
-        assert "rubygems.org" in result.registry_url
+    assert result.name == "rails"
+    assert result.version == "7.0.4"
+    assert result.registry == "rubygems"
+    assert "rubygems.org" in result.registry_url
 
 
-@pytest.mark.asyncio
-async def test_get_rubygems_version_not_found():
+async def test_get_rubygems_version_not_found(mock_http):
     """Test RubyGems gem not found"""
-    mock_response = MockResponse(404, text_data="Not found")
-
-    with patch("aiohttp.ClientSession", return_value=MockSession(mock_response)):
-        with pytest.raises(Exception, match="Package 'nonexistent' not found in RubyGems registry"):
-            await get_rubygems_version("nonexistent")
+    mock_http(404, text="Not found")
+    with pytest.raises(
+        PackageNotFoundError, match="Package 'nonexistent' not found in RubyGems registry"
+    ):
+        await get_rubygems_version("nonexistent")
@@ -2,8 +2,6 @@
 Tests for MCP registry tools functionality
 """
 
-import pytest
-
 # Note: MCP tools are tested indirectly through the registry tests
 # since they are thin wrappers around the registry functionality.
 # The main registry tests already cover the core functionality.
@@ -23,3 +21,32 @@ class TestRegistryTools:
         # This is tested implicitly when the app starts up
         # The tools registration happens in app.py
         pass
+
+    async def test_get_package_versions_reports_each_result(
+        self, monkeypatch, restore_timeout, mocked_aiohttp, registry_payloads
+    ):
+        """Test the batch tool returns results in order with failures in place"""
+        from fastmcp import Client
+
+        from versionator_mcp import create_app
+        from versionator_mcp.core import HTTPClient
+
+        # The app's lifespan applies the server config to the shared client
+        monkeypatch.setattr(HTTPClient, "_cache_ttl", HTTPClient._cache_ttl)
+
+        mocked_aiohttp.add(
+            "https://registry.npmjs.org/react/latest", payload=registry_payloads["npm"]
+        )
+        packages = [
+            {"package_manager": "node", "package_name": "react"},
+            {"package_manager": "invalid-registry", "package_name": "pkg"},
+        ]
+
+        async with Client(create_app()) as client:
+            result = await client.call_tool("get_package_versions", {"packages": packages})
+
+        found, failed = result.structured_content["result"]
+        assert found["registry"] == "npm"
+        assert found["version"] == "18.2.0"
+        assert failed["package_manager"] == "invalid-registry"
+        assert failed["error"].startswith("ValueError: Unknown package manager")
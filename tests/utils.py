@@ -10,7 +10,12 @@ from versionator_mcp.core.http_client import HTTPClient
 
 def set_request_timeout(timeout: int) -> None:
     """Set the request timeout for API calls (compatibility function)"""
-    HTTPClient._default_timeout = timeout
+    HTTPClient.set_default_timeout(timeout)
+
+
+def get_request_timeout() -> int:
+    """Get the request timeout for API calls (compatibility function)"""
+    return HTTPClient().timeout
 
 
 async def get_latest_version(package_manager: str, package_name: str):
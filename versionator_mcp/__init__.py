@@ -5,8 +5,22 @@ An MCP server that queries package registries (npm, RubyGems, PyPI, Hex.pm)
 for the latest release versions of packages.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __all__ = ["create_app", "get_config"]
 
-from .app import create_app
 from .config import get_config
+
+if TYPE_CHECKING:
+    from .app import create_app
+
+
+def __getattr__(name: str) -> Any:
+    # create_app is loaded on first use so that importing the registries alone
+    # does not pull in FastMCP and its dependency tree
+    if name == "create_app":
+        from .app import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -27,23 +27,33 @@ def create_app() -> FastMCP:
             level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         logger = logging.getLogger("versionator-mcp-server")
+        warmup_task = None
 
         try:
             # Get configuration
             config = get_config()
 
-            # Set timeout in HTTP client
+            # Set timeout and response cache TTL in HTTP client
             from .core.http_client import HTTPClient
 
-            HTTPClient._default_timeout = config.request_timeout
+            HTTPClient.set_default_timeout(config.request_timeout)
+            HTTPClient.set_cache_ttl(config.cache_ttl)
 
             logger.info(f"Versionator MCP Server starting...")
             logger.info(f"Request timeout: {config.request_timeout}s")
+            logger.info(f"Cache TTL: {config.cache_ttl}s")
+
+            if config.warmup:
+                from .registries import REGISTRY_ORIGINS
+
+                # Runs in the background so startup is not held up by slow hosts
+                warmup_task = asyncio.create_task(HTTPClient().warm_up(REGISTRY_ORIGINS))
+                logger.info(f"Warming connections to {len(REGISTRY_ORIGINS)} registries")
             logger.info(
                 f"Supported registries: npm, rubygems, pypi, hex, crates, bioconda, cran, terraform, dockerhub, cpan, go, composer, nuget, homebrew, nextflow, nf-core-module, nf-core-subworkflow, swift, maven"
             )
             logger.info(
-                f"Available functions: get_package_version, get_npm_package, get_ruby_gem, get_python_package, get_elixir_package, get_rust_crate, get_bioconda_package, get_r_package, get_terraform_provider, get_docker_image, get_perl_module, get_go_module, get_php_package, get_dotnet_package, get_homebrew_formula, get_nextflow_pipeline, get_nfcore_module, get_nfcore_subworkflow, get_swift_package, get_maven_artifact"
+                f"Available functions: get_package_version, get_package_versions, get_npm_package, get_ruby_gem, get_python_package, get_elixir_package, get_rust_crate, get_bioconda_package, get_r_package, get_terraform_provider, get_docker_image, get_perl_module, get_go_module, get_php_package, get_dotnet_package, get_homebrew_formula, get_nextflow_pipeline, get_nfcore_module, get_nfcore_subworkflow, get_swift_package, get_maven_artifact"
             )
 
             yield
@@ -52,6 +62,11 @@ def create_app() -> FastMCP:
             logger.error(f"Failed to initialize server: {e}")
             raise
         finally:
+            from .core.http_client import HTTPClient
+
+            if warmup_task is not None and not warmup_task.done():
+                warmup_task.cancel()
+            await HTTPClient.close_session()
             logger.info("Versionator MCP Server shutdown complete")
 
     # Prepare FastMCP system prompt (instructions) to guide LLMs when connected via MCP
@@ -60,6 +75,7 @@ def create_app() -> FastMCP:
         "the latest versions of packages. Follow these rules:\n\n"
         "1) Call explore_versionator-mcp-server_data_model once at the start to understand available functions.\n"
         "2) Use get_package_version(package_manager, package_name) for general package queries.\n"
+        "   Use get_package_versions(packages) to look up several packages in one call.\n"
         "3) Use specific registry functions for targeted queries:\n"
         "   - get_npm_package(package_name) for npm packages\n"
         "   - get_ruby_gem(gem_name) for Ruby gems\n"
@@ -17,6 +17,8 @@ class AppConfig:
     external_ip: str
     transport_mode: str
     request_timeout: int
+    cache_ttl: int
+    warmup: bool
 
 
 def get_config() -> AppConfig:
@@ -30,6 +32,8 @@ def get_config() -> AppConfig:
 
     # API configuration
     request_timeout = int(os.getenv("VERSIONATOR_REQUEST_TIMEOUT", "30"))
+    cache_ttl = int(os.getenv("VERSIONATOR_CACHE_TTL", "60"))
+    warmup = os.getenv("VERSIONATOR_WARMUP", "false").lower() in ("1", "true", "yes")
 
     # Validate configuration
     if mcp_port < 1 or mcp_port > 65535:
@@ -38,10 +42,15 @@ def get_config() -> AppConfig:
     if request_timeout < 1:
         raise ValueError(f"Invalid request timeout: {request_timeout}")
 
+    if cache_ttl < 0:
+        raise ValueError(f"Invalid cache TTL: {cache_ttl}")
+
     return AppConfig(
         mcp_host=mcp_host,
         mcp_port=mcp_port,
         external_ip=external_ip,
         transport_mode=transport_mode,
         request_timeout=request_timeout,
+        cache_ttl=cache_ttl,
+        warmup=warmup,
     )
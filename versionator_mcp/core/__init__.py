@@ -3,10 +3,12 @@ Core utilities and base classes for Versionator MCP Server
 """
 
 from .base_registry import BaseRegistry
+from .exceptions import PackageNotFoundError, RegistryAPIError
 from .http_client import HTTPClient
 from .registry_factory import (
     RegistryFactory,
     get_available_registries,
+    get_latest_versions,
     get_registry,
     register_registry,
 )
@@ -14,8 +16,11 @@ from .registry_factory import (
 __all__ = [
     "BaseRegistry",
     "HTTPClient",
+    "PackageNotFoundError",
+    "RegistryAPIError",
     "RegistryFactory",
     "get_registry",
     "register_registry",
     "get_available_registries",
+    "get_latest_versions",
 ]
@@ -4,6 +4,7 @@ Abstract base class for package registry implementations
 
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
+from urllib.parse import quote
 
 from ..models import PackageVersion
 
@@ -41,7 +42,8 @@ class BaseRegistry(ABC):
 
         Raises:
             ValueError: If package name is invalid
-            Exception: If API call fails
+            PackageNotFoundError: If the package or a usable version does not exist
+            RegistryAPIError: If the registry API call fails
         """
         pass
 
@@ -61,3 +63,45 @@ class BaseRegistry(ABC):
         if not package_name or not package_name.strip():
             raise ValueError("Package name cannot be empty")
         return package_name.strip()
+
+    def quote_name(self, name: str) -> str:
+        """
+        Percent-encode a package name as a single URL path segment.
+
+        Slashes are encoded too, so a name such as "pkg/../../other" stays one
+        segment instead of walking up the registry's URL path. @ is left as-is
+        for npm scopes, which the registry accepts as "@scope%2Fname".
+
+        Args:
+            name: The validated package name or name component
+
+        Returns:
+            The name, safe to interpolate into a URL
+
+        Raises:
+            ValueError: If the name is empty, "." or "..", which no encoding
+                keeps from being read as a relative path segment
+        """
+        if name in ("", ".", ".."):
+            raise ValueError(f"Invalid package name '{name}'")
+        return quote(name, safe="@")
+
+    def quote_path(self, name: str) -> str:
+        """
+        Percent-encode a slash-separated name, such as owner/repo, for a registry URL.
+
+        Each segment is encoded with quote_name and the slashes between them kept.
+
+        Args:
+            name: The validated slash-separated name
+
+        Returns:
+            The name, safe to interpolate into a URL
+
+        Raises:
+            ValueError: If a segment is empty, "." or ".."
+        """
+        segments = name.split("/")
+        if any(segment in ("", ".", "..") for segment in segments):
+            raise ValueError(f"Invalid path segment in package name '{name}'")
+        return "/".join(self.quote_name(segment) for segment in segments)
@@ -0,0 +1,11 @@
+"""
+Exceptions raised by registry lookups
+"""
+
+
+class PackageNotFoundError(LookupError):
+    """The registry has no such package, or no usable version for it"""
+
+
+class RegistryAPIError(RuntimeError):
+    """The registry answered with an unexpected HTTP status"""
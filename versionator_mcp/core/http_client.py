@@ -2,32 +2,278 @@
 Shared HTTP client utilities for registry API calls
 """
 
-import os
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import asyncio
+import random
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlsplit
 
 import aiohttp
+import orjson
+
+from .exceptions import PackageNotFoundError, RegistryAPIError
+
+# Sent when a registry does not need its own headers; read-only so it can be shared
+_JSON_HEADERS: Mapping[str, str] = MappingProxyType({"Accept": "application/json"})
+
+# Returned by _fetch_json when a conditional request is answered with 304
+_NOT_MODIFIED = object()
+
+# Concurrent requests per host, matching the connector's limit_per_host
+_DEFAULT_HOST_LIMIT = 20
+
+# Bytes of an error response body quoted in RegistryAPIError messages
+_ERROR_BODY_LIMIT = 2048
+
+# Rate limiting and transient upstream failures, which are worth another attempt
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_T = TypeVar("_T")
+
+
+async def _close_with_loop(session: aiohttp.ClientSession) -> AsyncGenerator[None, None]:
+    """Hold a session open until close_session or its event loop's shutdown
+
+    asyncio.run() finalizes pending async generators before it closes the loop,
+    so the session's connections are closed on the loop that owns them.
+    """
+    try:
+        yield
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+def _flight_key(
+    kind: str, url: str, headers: Optional[Mapping[str, str]], *names: str
+) -> Tuple[Hashable, ...]:
+    """Return the in-flight table key for a request and the names its errors report"""
+    header_items = tuple(sorted(headers.items())) if headers is not None else None
+    return (kind, url, header_items, *names)
+
+
+@lru_cache(maxsize=None)
+def _client_timeout(total: int) -> aiohttp.ClientTimeout:
+    """Return the shared ClientTimeout for a total timeout in seconds"""
+    return aiohttp.ClientTimeout(total=total)
 
 
 class HTTPClient:
     """Shared HTTP client with common functionality for registry APIs"""
 
+    # VERSIONATOR_REQUEST_TIMEOUT is applied, once validated, through set_default_timeout
     _default_timeout: int = 30
 
+    # One connection pool for the whole process so registry hosts are reached over
+    # warm keep-alive connections instead of a fresh TCP+TLS handshake per call
+    _session: Optional[aiohttp.ClientSession] = None
+
+    # Event loop the session and host semaphores are bound to. A lookup on another
+    # loop, such as a second asyncio.run(), gets a fresh session and semaphores.
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # Started _close_with_loop generator for the session, closing it with its loop
+    _closer: Optional[AsyncGenerator[None, None]] = None
+
+    # Successful JSON responses keyed by URL as (stored_at, etag, data), served for
+    # _cache_ttl seconds (0 disables) and then revalidated with If-None-Match
+    _cache_ttl: int = 60
+    _cache_maxsize: int = 1024
+    _cache: Dict[str, Tuple[float, Optional[str], Any]] = {}
+
+    # Requests currently on the wire, so concurrent identical lookups share one
+    # round-trip whether or not caching is enabled. Keyed by _flight_key, which
+    # includes the names an error is reported with: registries sharing a URL, such
+    # as Go and Swift on GitHub releases, must not see each other's errors.
+    _inflight: Dict[Tuple[Hashable, ...], "asyncio.Task[Any]"] = {}
+
+    # Hosts that need a tighter concurrency cap than the pool's per-host limit.
+    # GitHub's secondary rate limit answers bursts with 403/429 rather than queueing.
+    _host_limits: Dict[str, int] = {"api.github.com": 8}
+    _host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    # Retries after a retryable status, backing off exponentially from _retry_backoff
+    # seconds with jitter, or waiting as long as the registry's Retry-After asks
+    _max_retries: int = 2
+    _retry_backoff: float = 0.5
+
+    # Last formatted query timestamp as (epoch second, ISO string), reused for
+    # lookups that finish within the same second
+    _timestamp: Tuple[int, str] = (-1, "")
+
     def __init__(self, timeout: Optional[int] = None):
         """Initialize HTTP client with configurable timeout"""
-        if timeout is None:
-            timeout = getattr(
-                self.__class__,
-                "_default_timeout",
-                int(os.getenv("VERSIONATOR_REQUEST_TIMEOUT", "30")),
+        self._timeout = timeout
+
+    @property
+    def timeout(self) -> int:
+        """Request timeout in seconds, falling back to the current class default
+
+        Resolved on access rather than at construction, because the factory's
+        client is created at import time, before the server config is applied.
+        """
+        if self._timeout is not None:
+            return self._timeout
+        return HTTPClient._default_timeout
+
+    @property
+    def client_timeout(self) -> aiohttp.ClientTimeout:
+        """The ClientTimeout for this client's current timeout, built once per value"""
+        return _client_timeout(self.timeout)
+
+    @classmethod
+    def set_default_timeout(cls, timeout: int) -> None:
+        """Set the default request timeout in seconds for clients without their own"""
+        if timeout <= 0:
+            raise ValueError(f"Invalid request timeout: {timeout}")
+        HTTPClient._default_timeout = timeout
+
+    @classmethod
+    def set_cache_ttl(cls, ttl: int) -> None:
+        """Set how many seconds successful responses are cached for; 0 disables caching"""
+        if ttl < 0:
+            raise ValueError(f"Invalid cache TTL: {ttl}")
+        HTTPClient._cache_ttl = ttl
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared client session, creating it on first use or on a new loop"""
+        loop = asyncio.get_running_loop()
+        if HTTPClient._loop is not None and HTTPClient._loop is not loop:
+            HTTPClient._discard_loop_state()
+        HTTPClient._loop = loop
+
+        session = HTTPClient._session
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=self.client_timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=_DEFAULT_HOST_LIMIT,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300,
+                ),
             )
-        self.timeout = timeout
+            await HTTPClient._bind_session(session)
+        return session
+
+    @classmethod
+    async def set_session(cls, session: aiohttp.ClientSession) -> None:
+        """Use a caller-provided session as the shared session for all clients
+
+        The session it replaces is closed first, along with the host semaphores
+        bound to it. The new session is closed by close_session like one created
+        on demand, and must belong to the running event loop.
+        """
+        if session is not cls._session:
+            await cls.close_session()
+        await cls._bind_session(session)
+
+    @classmethod
+    async def _bind_session(cls, session: aiohttp.ClientSession) -> None:
+        """Share a session on the running loop, to be closed when that loop shuts down"""
+        closer = _close_with_loop(session)
+        await closer.__anext__()
+        previous = cls._closer
+        HTTPClient._session = session
+        HTTPClient._loop = asyncio.get_running_loop()
+        HTTPClient._closer = closer
+        if previous is not None:
+            await previous.aclose()
+
+    @classmethod
+    def _discard_loop_state(cls) -> None:
+        """Forget the session, semaphores and in-flight requests of another event loop
+
+        The session cannot be closed from here, as its connections belong to the
+        other loop. Its _close_with_loop generator closes it there instead: when the
+        loop shuts down, or once the dropped generator is finalized if it still runs.
+        """
+        cls._session = None
+        cls._loop = None
+        cls._closer = None
+        cls._host_semaphores.clear()
+        cls._inflight.clear()
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Close the shared client session if one is open"""
+        if cls._loop is not None and cls._loop is not asyncio.get_running_loop():
+            cls._discard_loop_state()
+            return
+
+        closer = cls._closer
+        cls._session = None
+        cls._loop = None
+        cls._closer = None
+        # Semaphores bind to the running loop, so start fresh with the next session
+        cls._host_semaphores.clear()
+        if closer is not None:
+            await closer.aclose()
+
+    async def warm_up(self, urls: Iterable[str]) -> None:
+        """Open pooled connections to the given origins ahead of the first lookup
+
+        Sends a HEAD request to each URL so DNS, TCP and TLS setup happen before
+        a user's query. Failures are ignored; lookups still report their own errors.
+        """
+        session = await self.get_session()
+
+        async def head(url: str) -> None:
+            async with session.head(url, allow_redirects=False, timeout=self.client_timeout):
+                pass
+
+        await asyncio.gather(*(head(url) for url in urls), return_exceptions=True)
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent requests to the URL's host"""
+        host = urlsplit(url).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._host_limits.get(host, _DEFAULT_HOST_LIMIT))
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discard all cached responses"""
+        cls._cache.clear()
+
+    def _get_cached(self, url: str) -> Optional[Any]:
+        """Return the cached response for a URL if it is still fresh"""
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        stored_at, _, data = entry
+        if time.monotonic() - stored_at >= self._cache_ttl:
+            return None
+        return data
+
+    def _store_cached(self, url: str, etag: Optional[str], data: Any) -> None:
+        """Cache a response, evicting the oldest entries beyond the size limit"""
+        cache = self._cache
+        cache.pop(url, None)
+        cache[url] = (time.monotonic(), etag, data)
+        while len(cache) > self._cache_maxsize:
+            cache.pop(next(iter(cache)))
 
     async def get_json(
         self,
         url: str,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         registry_name: str = "unknown",
         package_name: str = "unknown",
     ) -> Any:
@@ -41,28 +287,200 @@ class HTTPClient:
             package_name: Name of the package for error messages
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, served from the response cache when a
+            fresh entry exists
 
         Raises:
-            Exception: If request fails or package not found
+            PackageNotFoundError: If the registry returns 404
+            RegistryAPIError: If the registry returns any other non-200 status
+        """
+        if self._cache_ttl > 0:
+            data = self._get_cached(url)
+            if data is not None:
+                return data
+
+        return await self._single_flight(
+            _flight_key("json", url, headers, registry_name, package_name),
+            lambda: self._fetch_and_store(url, headers, registry_name, package_name),
+        )
+
+    async def get_status(
+        self, url: str, headers: Optional[Mapping[str, str]] = None
+    ) -> Tuple[int, str]:
+        """
+        Make a GET request and return its status for registries that do not serve JSON.
+
+        The request shares get_json's host limit, retries and single-flight, but it
+        is not cached and error statuses are left to the caller to report.
+
+        Args:
+            url: The URL to request
+            headers: Optional HTTP headers
+
+        Returns:
+            The response status, and the start of the body when it is not 200
+        """
+        return await self._single_flight(
+            _flight_key("status", url, headers),
+            lambda: self._request(url, headers, self._read_status),
+        )
+
+    async def _single_flight(
+        self, key: Tuple[Hashable, ...], request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Await the request in flight for a key, starting it if there is none"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+
+        # Shielded so one cancelled caller does not cancel the request for the others
+        result: _T = await asyncio.shield(task)
+        return result
+
+    def _forget_inflight(self, key: Tuple[Hashable, ...], task: "asyncio.Task[Any]") -> None:
+        """Drop a finished request from the in-flight table"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _fetch_and_store(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        registry_name: str,
+        package_name: str,
+    ) -> Any:
+        """Fetch a URL and cache the response when caching is enabled
+
+        A stale cached entry with an ETag is revalidated with If-None-Match, and a
+        304 reply reuses the cached body instead of downloading it again.
+        """
+        if self._cache_ttl <= 0:
+            data, _ = await self._fetch_json(url, headers, registry_name, package_name)
+            return data
+
+        entry = self._cache.get(url)
+        cached_etag = entry[1] if entry is not None else None
+
+        data, etag = await self._fetch_json(url, headers, registry_name, package_name, cached_etag)
+        if data is _NOT_MODIFIED and entry is not None:
+            data = entry[2]
+            etag = etag or cached_etag
+        self._store_cached(url, etag, data)
+        return data
+
+    async def _fetch_json(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        registry_name: str,
+        package_name: str,
+        etag: Optional[str] = None,
+    ) -> Tuple[Any, Optional[str]]:
+        """Request a URL from the registry and return the decoded JSON body and ETag
+
+        With an ETag the request is conditional, and a 304 reply returns
+        _NOT_MODIFIED in place of the body.
+        """
+        if headers is None:
+            headers = _JSON_HEADERS
+        if etag is not None:
+            headers = {**headers, "If-None-Match": etag}
+
+        return await self._request(
+            url,
+            headers,
+            lambda response: self._read_json(response, registry_name, package_name, etag),
+        )
+
+    async def _request(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+        read: Callable[[aiohttp.ClientResponse], Awaitable[_T]],
+    ) -> _T:
+        """GET a URL within its host's limit and return what read makes of the response
+
+        Rate-limited and transient 5xx replies are retried up to _max_retries
+        times before the last of them is passed to read.
         """
         if headers is None:
-            headers = {"Accept": "application/json"}
-
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 404:
-                    raise Exception(
-                        f"Package '{package_name}' not found in {registry_name} registry"
-                    )
-                elif response.status != 200:
-                    text = await response.text()
-                    raise Exception(f"{registry_name} API error {response.status}: {text}")
-
-                json_data = await response.json()
-                return json_data
+            headers = _JSON_HEADERS
+
+        session = await self.get_session()
+        attempt = 0
+        while True:
+            delay = None
+            # Passed per request so a timeout changed after the session opened still applies
+            async with (
+                self._host_semaphore(url),
+                session.get(url, headers=headers, timeout=self.client_timeout) as response,
+            ):
+                if response.status in _RETRY_STATUSES and attempt < self._max_retries:
+                    delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
+                if delay is None:
+                    return await read(response)
+
+            # Wait outside the host semaphore so other lookups can use the slot
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, retry_after: Optional[str], attempt: int) -> Optional[float]:
+        """Seconds to wait before the next attempt, or None to give up now
+
+        A Retry-After longer than the request timeout is not worth waiting for,
+        so the error is reported straight away instead.
+        """
+        delay: float = self._retry_backoff * 2**attempt + random.uniform(0, self._retry_backoff)
+        if retry_after is not None and retry_after.isdigit():
+            if int(retry_after) > self.timeout:
+                return None
+            delay = max(delay, int(retry_after))
+        return delay
+
+    async def _read_json(
+        self,
+        response: aiohttp.ClientResponse,
+        registry_name: str,
+        package_name: str,
+        etag: Optional[str],
+    ) -> Tuple[Any, Optional[str]]:
+        """Return the decoded JSON body and ETag of a response, raising on error statuses"""
+        if response.status == 304 and etag is not None:
+            return _NOT_MODIFIED, response.headers.get("ETag")
+        elif response.status == 404:
+            raise PackageNotFoundError(
+                f"Package '{package_name}' not found in {registry_name} registry"
+            )
+        elif response.status != 200:
+            text = await self._error_text(response)
+            raise RegistryAPIError(f"{registry_name} API error {response.status}: {text}")
+
+        # Decode the raw body with orjson rather than aiohttp's stdlib-json path
+        json_data = orjson.loads(await response.read())
+        return json_data, response.headers.get("ETag")
+
+    async def _read_status(self, response: aiohttp.ClientResponse) -> Tuple[int, str]:
+        """Return a response's status, with the start of its body unless it is 200"""
+        if response.status == 200:
+            return 200, ""
+        return response.status, await self._error_text(response)
+
+    async def _error_text(self, response: aiohttp.ClientResponse) -> str:
+        """Return the start of an error response body for an error message
+
+        Reads at most _ERROR_BODY_LIMIT bytes, so an outage's HTML error page is
+        never buffered and decoded whole.
+        """
+        body = await response.content.read(_ERROR_BODY_LIMIT)
+        return body.decode("utf-8", errors="replace")
 
     def get_current_timestamp(self) -> str:
-        """Get current timestamp in ISO format with Z suffix"""
-        return datetime.now(timezone.utc).isoformat() + "Z"
+        """Get current UTC timestamp in ISO format with Z suffix, to the second"""
+        now = int(time.time())
+        second, timestamp = HTTPClient._timestamp
+        if now != second:
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+            HTTPClient._timestamp = (now, timestamp)
+        return timestamp
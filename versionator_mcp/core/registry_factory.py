@@ -2,8 +2,11 @@
 Registry factory for creating and managing package registry instances
 """
 
-from typing import Dict, Optional, Type
+import asyncio
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Type, Union
 
+from ..models import PackageVersion
 from .base_registry import BaseRegistry
 from .http_client import HTTPClient
 
@@ -14,8 +17,14 @@ class RegistryFactory:
     def __init__(self) -> None:
         self._registries: Dict[str, Type[BaseRegistry]] = {}
         self._aliases: Dict[str, str] = {}
+        self._instances: Dict[str, BaseRegistry] = {}
         self._http_client = HTTPClient()
 
+        # Read-only name/alias -> instance table, rebuilt on each registration.
+        # Registries are stateless, so one instance per registry serves every lookup.
+        self._dispatch: Mapping[str, BaseRegistry] = MappingProxyType({})
+        self._valid_options = ""
+
     def register(
         self, registry_class: Type[BaseRegistry], aliases: Optional[list[str]] = None
     ) -> None:
@@ -31,12 +40,21 @@ class RegistryFactory:
         registry_name = instance.registry_name
 
         self._registries[registry_name] = registry_class
+        self._instances[registry_name] = instance
 
         # Register aliases
         if aliases:
             for alias in aliases:
                 self._aliases[alias.lower()] = registry_name
 
+        # Aliases take precedence over registry names, matching lookup order
+        dispatch = dict(self._instances)
+        for alias, target in self._aliases.items():
+            dispatch[alias] = self._instances[target]
+        self._dispatch = MappingProxyType(dispatch)
+        # Only needed for error messages, but cheaper to build once here than per miss
+        self._valid_options = ", ".join(sorted(dispatch))
+
     def get_registry(self, name: str) -> BaseRegistry:
         """
         Get a registry instance by name or alias.
@@ -52,24 +70,38 @@ class RegistryFactory:
         """
         name = name.lower().strip()
 
-        # Check if it's an alias first
-        if name in self._aliases:
-            registry_name = self._aliases[name]
-        else:
-            registry_name = name
-
-        if registry_name not in self._registries:
-            available = sorted(set(list(self._registries.keys()) + list(self._aliases.keys())))
+        registry = self._dispatch.get(name)
+        if registry is None:
             raise ValueError(
-                f"Unknown package manager '{name}'. Valid options: {', '.join(available)}"
+                f"Unknown package manager '{name}'. Valid options: {self._valid_options}"
             )
 
-        registry_class = self._registries[registry_name]
-        return registry_class(self._http_client)
+        return registry
 
     def get_available_registries(self) -> list[str]:
         """Get list of all available registry names and aliases"""
-        return sorted(set(list(self._registries.keys()) + list(self._aliases.keys())))
+        return sorted(self._dispatch)
+
+    async def get_latest_versions(
+        self, requests: list[tuple[str, str]]
+    ) -> list[Union[PackageVersion, BaseException]]:
+        """
+        Get the latest versions of several packages concurrently.
+
+        Args:
+            requests: (package_manager, package_name) pairs to query
+
+        Returns:
+            Results in request order; a failed lookup is returned as its exception
+        """
+
+        async def lookup(package_manager: str, package_name: str) -> PackageVersion:
+            registry = self.get_registry(package_manager)
+            return await registry.get_latest_version(package_name)
+
+        return await asyncio.gather(
+            *(lookup(manager, package) for manager, package in requests), return_exceptions=True
+        )
 
 
 # Global factory instance
@@ -91,3 +123,10 @@ def get_registry(name: str) -> BaseRegistry:
 def get_available_registries() -> list[str]:
     """Get list of all available registry names and aliases"""
     return _factory.get_available_registries()
+
+
+async def get_latest_versions(
+    requests: list[tuple[str, str]],
+) -> list[Union[PackageVersion, BaseException]]:
+    """Get the latest versions of several packages concurrently from the global factory"""
+    return await _factory.get_latest_versions(requests)
@@ -9,6 +9,13 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+class PackageQuery(BaseModel):
+    """A single package lookup in a batch request"""
+
+    package_manager: str = Field(description="The package registry name or alias")
+    package_name: str = Field(description="The package name")
+
+
 class PackageVersion(BaseModel):
     """Represents a package version from a registry"""
 
@@ -24,6 +24,27 @@ from . import (
     terraform,
 )
 
+# API origins queried by the registries above, pre-connected at startup when
+# VERSIONATOR_WARMUP is enabled. api.github.com is left out so warm-up never
+# spends the unauthenticated GitHub rate limit.
+REGISTRY_ORIGINS = (
+    "https://registry.npmjs.org/",
+    "https://rubygems.org/",
+    "https://pypi.org/",
+    "https://hex.pm/",
+    "https://crates.io/",
+    "https://api.anaconda.org/",
+    "https://crandb.r-pkg.org/",
+    "https://registry.terraform.io/",
+    "https://hub.docker.com/",
+    "https://fastapi.metacpan.org/",
+    "https://pkg.go.dev/",
+    "https://packagist.org/",
+    "https://api.nuget.org/",
+    "https://formulae.brew.sh/",
+    "https://search.maven.org/",
+)
+
 __all__ = [
     "npm",
     "rubygems",
@@ -16,7 +16,7 @@ class BiocondaRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of a Bioconda package from anaconda.org"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://api.anaconda.org/package/bioconda/{package_name}"
+        url = f"https://api.anaconda.org/package/bioconda/{self.quote_name(package_name)}"
 
         data = await self.http_client.get_json(
             url, registry_name="Bioconda", package_name=package_name
@@ -2,10 +2,23 @@
 Composer (Packagist) registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from operator import itemgetter
+from typing import Optional
+
+from packaging.version import InvalidVersion, Version
+
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
+def _parse_version(version: str) -> Optional[Version]:
+    """Parse a Packagist version, or return None for branches like dev-main"""
+    try:
+        return Version(version)
+    except InvalidVersion:
+        return None
+
+
 class ComposerRegistry(BaseRegistry):
     """PHP Composer (Packagist) registry implementation"""
 
@@ -16,7 +29,7 @@ class ComposerRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of a PHP Composer package from Packagist"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://packagist.org/packages/{package_name}.json"
+        url = f"https://packagist.org/packages/{self.quote_path(package_name)}.json"
 
         data = await self.http_client.get_json(
             url, registry_name="Packagist", package_name=package_name
@@ -26,16 +39,17 @@ class ComposerRegistry(BaseRegistry):
         # Get the latest version from versions
         versions = package_info.get("versions", {})
         if not versions:
-            raise Exception(f"No versions found for package '{package_name}'")
+            raise PackageNotFoundError(f"No versions found for package '{package_name}'")
 
-        # Find the latest stable version (not dev)
-        stable_versions = [v for v in versions.keys() if not v.endswith("-dev")]
-        if not stable_versions:
-            # If no stable versions, use the first available
-            latest_version = list(versions.keys())[0]
+        # Pick the highest release by version order rather than string order, so
+        # v1.10.0 beats v1.9.0; pre-releases count only when there is nothing else
+        parsed = [(v, p) for v in versions if (p := _parse_version(v)) is not None]
+        releases = [item for item in parsed if not item[1].is_prerelease] or parsed
+        if releases:
+            latest_version = max(releases, key=itemgetter(1))[0]
         else:
-            # Sort versions and get the latest
-            latest_version = sorted(stable_versions, reverse=True)[0]
+            # If only branches are published, use the first available
+            latest_version = next(iter(versions))
 
         version_data = versions[latest_version]
 
@@ -2,9 +2,18 @@
 CPAN registry implementation
 """
 
+from types import MappingProxyType
+
 from ..core import BaseRegistry, register_registry
 from ..models import PackageVersion
 
+_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json",
+        "User-Agent": "versionator-mcp/1.0 (Package Version Query Tool)",
+    }
+)
+
 
 class CPANRegistry(BaseRegistry):
     """CPAN module registry implementation"""
@@ -16,15 +25,10 @@ class CPANRegistry(BaseRegistry):
     async def get_latest_version(self, module_name: str) -> PackageVersion:
         """Get the latest version of a Perl module from CPAN via MetaCPAN"""
         module_name = self.validate_package_name(module_name)
-        url = f"https://fastapi.metacpan.org/v1/module/{module_name}"
-
-        headers = {
-            "Accept": "application/json",
-            "User-Agent": "versionator-mcp/1.0 (Package Version Query Tool)",
-        }
+        url = f"https://fastapi.metacpan.org/v1/module/{self.quote_name(module_name)}"
 
         data = await self.http_client.get_json(
-            url, headers=headers, registry_name="CPAN", package_name=module_name
+            url, headers=_HEADERS, registry_name="CPAN", package_name=module_name
         )
 
         return PackageVersion(
@@ -16,7 +16,7 @@ class CRANRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of an R package from CRAN via crandb"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://crandb.r-pkg.org/{package_name}"
+        url = f"https://crandb.r-pkg.org/{self.quote_name(package_name)}"
 
         data = await self.http_client.get_json(url, registry_name="CRAN", package_name=package_name)
 
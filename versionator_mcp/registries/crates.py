@@ -16,7 +16,7 @@ class CratesRegistry(BaseRegistry):
     async def get_latest_version(self, crate_name: str) -> PackageVersion:
         """Get the latest version of a Rust crate from crates.io"""
         crate_name = self.validate_package_name(crate_name)
-        url = f"https://crates.io/api/v1/crates/{crate_name}"
+        url = f"https://crates.io/api/v1/crates/{self.quote_name(crate_name)}"
 
         data = await self.http_client.get_json(
             url, registry_name="crates.io", package_name=crate_name
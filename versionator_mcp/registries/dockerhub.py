@@ -2,7 +2,7 @@
 DockerHub registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -24,7 +24,8 @@ class DockerHubRegistry(BaseRegistry):
         else:
             namespace, repo_name = image_name.split("/", 1)
 
-        url = f"https://hub.docker.com/v2/repositories/{namespace}/{repo_name}/tags"
+        repository = self.quote_path(f"{namespace}/{repo_name}")
+        url = f"https://hub.docker.com/v2/repositories/{repository}/tags"
 
         data = await self.http_client.get_json(
             url, registry_name="DockerHub", package_name=image_name
@@ -32,7 +33,7 @@ class DockerHubRegistry(BaseRegistry):
         results = data.get("results", [])
 
         if not results:
-            raise Exception(f"No tags found for image '{image_name}'")
+            raise PackageNotFoundError(f"No tags found for image '{image_name}'")
 
         # Get the first tag (latest by default from DockerHub API)
         latest_tag = results[0]
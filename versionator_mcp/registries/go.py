@@ -2,11 +2,21 @@
 Go modules registry implementation
 """
 
-import aiohttp
+from types import MappingProxyType
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, RegistryAPIError, register_registry
 from ..models import PackageVersion
 
+_GITHUB_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "versionator-mcp/1.0 (Package Version Query Tool)",
+    }
+)
+_HTML_HEADERS = MappingProxyType(
+    {"Accept": "text/html", "User-Agent": "versionator-mcp/1.0 (Package Version Query Tool)"}
+)
+
 
 class GoRegistry(BaseRegistry):
     """Go modules registry implementation"""
@@ -27,15 +37,11 @@ class GoRegistry(BaseRegistry):
                 repo = parts[2]
 
                 # Use GitHub API to get latest release
-                url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
-
-                headers = {
-                    "Accept": "application/vnd.github.v3+json",
-                    "User-Agent": "versionator-mcp/1.0 (Package Version Query Tool)",
-                }
+                repo_path = self.quote_path(f"{owner}/{repo}")
+                url = f"https://api.github.com/repos/{repo_path}/releases/latest"
 
                 data = await self.http_client.get_json(
-                    url, headers=headers, registry_name="GitHub", package_name=module_path
+                    url, headers=_GITHUB_HEADERS, registry_name="GitHub", package_name=module_path
                 )
 
                 return PackageVersion(
@@ -50,34 +56,26 @@ class GoRegistry(BaseRegistry):
                 )
 
         # For non-GitHub modules, try pkg.go.dev API
-        url = f"https://pkg.go.dev/{module_path}"
-
-        headers = {
-            "Accept": "text/html",
-            "User-Agent": "versionator-mcp/1.0 (Package Version Query Tool)",
-        }
-
-        timeout = aiohttp.ClientTimeout(total=self.http_client.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 404:
-                    raise Exception(f"Module '{module_path}' not found in Go module registry")
-                elif response.status != 200:
-                    text = await response.text()
-                    raise Exception(f"Go module API error {response.status}: {text}")
-
-                # For now, return a basic response since we can't parse HTML easily
-                # In a real implementation, you'd parse the HTML to extract version info
-                return PackageVersion(
-                    name=module_path,
-                    version="latest",  # Placeholder - would need HTML parsing to get actual version
-                    registry="go",
-                    registry_url=url,
-                    query_time=self.http_client.get_current_timestamp(),
-                    description=f"Go module {module_path}",
-                    homepage=url,
-                    license=None,
-                )
+        url = f"https://pkg.go.dev/{self.quote_path(module_path)}"
+
+        status, text = await self.http_client.get_status(url, headers=_HTML_HEADERS)
+        if status == 404:
+            raise PackageNotFoundError(f"Module '{module_path}' not found in Go module registry")
+        elif status != 200:
+            raise RegistryAPIError(f"Go module API error {status}: {text}")
+
+        # For now, return a basic response since we can't parse HTML easily
+        # In a real implementation, you'd parse the HTML to extract version info
+        return PackageVersion(
+            name=module_path,
+            version="latest",  # Placeholder - would need HTML parsing to get actual version
+            registry="go",
+            registry_url=url,
+            query_time=self.http_client.get_current_timestamp(),
+            description=f"Go module {module_path}",
+            homepage=url,
+            license=None,
+        )
 
 
 # Register with aliases
@@ -2,7 +2,7 @@
 Hex.pm registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -16,7 +16,7 @@ class HexRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of an Elixir package from Hex.pm"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://hex.pm/api/packages/{package_name}"
+        url = f"https://hex.pm/api/packages/{self.quote_name(package_name)}"
 
         data = await self.http_client.get_json(
             url, registry_name="Hex.pm", package_name=package_name
@@ -25,7 +25,7 @@ class HexRegistry(BaseRegistry):
         # Get the latest version from releases array (first item is latest)
         releases = data.get("releases", [])
         if not releases:
-            raise Exception(f"No releases found for package '{package_name}'")
+            raise PackageNotFoundError(f"No releases found for package '{package_name}'")
 
         latest_version = releases[0].get("version", "unknown")
         meta = data.get("meta", {})
@@ -2,7 +2,7 @@
 Homebrew registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -16,7 +16,7 @@ class HomebrewRegistry(BaseRegistry):
     async def get_latest_version(self, formula_name: str) -> PackageVersion:
         """Get the latest version of a Homebrew formula"""
         formula_name = self.validate_package_name(formula_name)
-        url = f"https://formulae.brew.sh/api/formula/{formula_name}.json"
+        url = f"https://formulae.brew.sh/api/formula/{self.quote_name(formula_name)}.json"
 
         data = await self.http_client.get_json(
             url, registry_name="Homebrew", package_name=formula_name
@@ -25,7 +25,7 @@ class HomebrewRegistry(BaseRegistry):
         stable_version = versions.get("stable")
 
         if not stable_version:
-            raise Exception(f"No stable version found for formula '{formula_name}'")
+            raise PackageNotFoundError(f"No stable version found for formula '{formula_name}'")
 
         return PackageVersion(
             name=formula_name,
@@ -2,7 +2,7 @@
 Maven Central registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -23,7 +23,8 @@ class MavenRegistry(BaseRegistry):
 
         group_id, artifact_id = artifact_name.split(":", 1)
 
-        url = f"https://search.maven.org/solrsearch/select?q=g:{group_id}+AND+a:{artifact_id}&rows=1&wt=json"
+        query = f"g:{self.quote_name(group_id)}+AND+a:{self.quote_name(artifact_id)}"
+        url = f"https://search.maven.org/solrsearch/select?q={query}&rows=1&wt=json"
 
         data = await self.http_client.get_json(
             url, registry_name="Maven Central", package_name=artifact_name
@@ -31,13 +32,13 @@ class MavenRegistry(BaseRegistry):
         docs = data.get("response", {}).get("docs", [])
 
         if not docs:
-            raise Exception(f"Artifact '{artifact_name}' not found")
+            raise PackageNotFoundError(f"Artifact '{artifact_name}' not found")
 
         doc = docs[0]
         latest_version = doc.get("latestVersion")
 
         if not latest_version:
-            raise Exception(f"No version found for artifact '{artifact_name}'")
+            raise PackageNotFoundError(f"No version found for artifact '{artifact_name}'")
 
         return PackageVersion(
             name=artifact_name,
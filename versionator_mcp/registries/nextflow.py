@@ -2,7 +2,7 @@
 Nextflow registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -23,7 +23,7 @@ class NextflowRegistry(BaseRegistry):
         else:
             repo_path = f"nf-core/{pipeline_name}"
 
-        url = f"https://api.github.com/repos/{repo_path}/releases/latest"
+        url = f"https://api.github.com/repos/{self.quote_path(repo_path)}/releases/latest"
 
         data = await self.http_client.get_json(
             url, registry_name="GitHub", package_name=pipeline_name
@@ -31,7 +31,7 @@ class NextflowRegistry(BaseRegistry):
         tag_name = data.get("tag_name")
 
         if not tag_name:
-            raise Exception(f"No release found for pipeline '{pipeline_name}'")
+            raise PackageNotFoundError(f"No release found for pipeline '{pipeline_name}'")
 
         return PackageVersion(
             name=pipeline_name,
@@ -2,7 +2,7 @@
 nf-core modules and subworkflows registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -19,14 +19,17 @@ class NFCoreModuleRegistry(BaseRegistry):
         module_path = f"modules/nf-core/{module_name}"
 
         # Check if module exists and get latest commit
-        url = f"https://api.github.com/repos/nf-core/modules/commits?path={module_path}&per_page=1"
+        url = (
+            "https://api.github.com/repos/nf-core/modules/commits"
+            f"?path={self.quote_path(module_path)}&per_page=1"
+        )
 
         data = await self.http_client.get_json(
             url, registry_name="GitHub", package_name=module_name
         )
 
         if not data or not isinstance(data, list):
-            raise Exception(f"Module '{module_name}' not found in nf-core/modules")
+            raise PackageNotFoundError(f"Module '{module_name}' not found in nf-core/modules")
 
         latest_commit = data[0]
         commit_sha = latest_commit["sha"][:7]  # Short SHA
@@ -57,14 +60,19 @@ class NFCoreSubworkflowRegistry(BaseRegistry):
         subworkflow_path = f"subworkflows/nf-core/{subworkflow_name}"
 
         # Check if subworkflow exists and get latest commit
-        url = f"https://api.github.com/repos/nf-core/modules/commits?path={subworkflow_path}&per_page=1"
+        url = (
+            "https://api.github.com/repos/nf-core/modules/commits"
+            f"?path={self.quote_path(subworkflow_path)}&per_page=1"
+        )
 
         data = await self.http_client.get_json(
             url, registry_name="GitHub", package_name=subworkflow_name
         )
 
         if not data or not isinstance(data, list):
-            raise Exception(f"Subworkflow '{subworkflow_name}' not found in nf-core/modules")
+            raise PackageNotFoundError(
+                f"Subworkflow '{subworkflow_name}' not found in nf-core/modules"
+            )
 
         latest_commit = data[0]
         commit_sha = latest_commit["sha"][:7]  # Short SHA
@@ -16,7 +16,7 @@ class NPMRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of an npm package"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://registry.npmjs.org/{package_name}/latest"
+        url = f"https://registry.npmjs.org/{self.quote_name(package_name)}/latest"
 
         data = await self.http_client.get_json(url, registry_name="npm", package_name=package_name)
 
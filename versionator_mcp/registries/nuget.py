@@ -2,7 +2,7 @@
 NuGet registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -16,7 +16,8 @@ class NuGetRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of a .NET NuGet package"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://api.nuget.org/v3-flatcontainer/{package_name.lower()}/index.json"
+        package_id = self.quote_name(package_name.lower())
+        url = f"https://api.nuget.org/v3-flatcontainer/{package_id}/index.json"
 
         data = await self.http_client.get_json(
             url, registry_name="NuGet", package_name=package_name
@@ -24,7 +25,7 @@ class NuGetRegistry(BaseRegistry):
         versions = data.get("versions", [])
 
         if not versions:
-            raise Exception(f"No versions found for package '{package_name}'")
+            raise PackageNotFoundError(f"No versions found for package '{package_name}'")
 
         # Get the latest version (last in the list)
         latest_version = versions[-1]
@@ -16,7 +16,7 @@ class PyPIRegistry(BaseRegistry):
     async def get_latest_version(self, package_name: str) -> PackageVersion:
         """Get the latest version of a Python package from PyPI"""
         package_name = self.validate_package_name(package_name)
-        url = f"https://pypi.org/pypi/{package_name}/json"
+        url = f"https://pypi.org/pypi/{self.quote_name(package_name)}/json"
 
         data = await self.http_client.get_json(url, registry_name="PyPI", package_name=package_name)
         info = data.get("info", {})
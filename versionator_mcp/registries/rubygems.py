@@ -16,7 +16,7 @@ class RubyGemsRegistry(BaseRegistry):
     async def get_latest_version(self, gem_name: str) -> PackageVersion:
         """Get the latest version of a Ruby gem"""
         gem_name = self.validate_package_name(gem_name)
-        url = f"https://rubygems.org/api/v1/versions/{gem_name}/latest.json"
+        url = f"https://rubygems.org/api/v1/versions/{self.quote_name(gem_name)}/latest.json"
 
         data = await self.http_client.get_json(url, registry_name="RubyGems", package_name=gem_name)
 
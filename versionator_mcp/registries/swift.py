@@ -2,7 +2,7 @@
 Swift Package Manager registry implementation
 """
 
-from ..core import BaseRegistry, register_registry
+from ..core import BaseRegistry, PackageNotFoundError, register_registry
 from ..models import PackageVersion
 
 
@@ -21,7 +21,7 @@ class SwiftRegistry(BaseRegistry):
         if "/" not in package_name:
             raise ValueError("Swift package name must be in 'owner/repo' format")
 
-        url = f"https://api.github.com/repos/{package_name}/releases/latest"
+        url = f"https://api.github.com/repos/{self.quote_path(package_name)}/releases/latest"
 
         data = await self.http_client.get_json(
             url, registry_name="GitHub", package_name=package_name
@@ -29,7 +29,7 @@ class SwiftRegistry(BaseRegistry):
         tag_name = data.get("tag_name")
 
         if not tag_name:
-            raise Exception(f"No release found for package '{package_name}'")
+            raise PackageNotFoundError(f"No release found for package '{package_name}'")
 
         return PackageVersion(
             name=package_name,
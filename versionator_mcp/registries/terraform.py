@@ -16,7 +16,7 @@ class TerraformRegistry(BaseRegistry):
     async def get_latest_version(self, provider_path: str) -> PackageVersion:
         """Get the latest version of a Terraform provider from registry.terraform.io"""
         provider_path = self.validate_package_name(provider_path)
-        url = f"https://registry.terraform.io/v1/providers/{provider_path}"
+        url = f"https://registry.terraform.io/v1/providers/{self.quote_path(provider_path)}"
 
         data = await self.http_client.get_json(
             url, registry_name="Terraform Registry", package_name=provider_path
@@ -2,11 +2,12 @@
 MCP tool registration for package registry functions
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from fastmcp import FastMCP
 
-from ..core import get_available_registries, get_registry
+from ..core import get_available_registries, get_latest_versions, get_registry
+from ..models import PackageQuery
 
 
 def register_versionator_tools(app: FastMCP) -> None:
@@ -67,6 +68,44 @@ def register_versionator_tools(app: FastMCP) -> None:
         version_info = await registry.get_latest_version(package_name)
         return version_info.model_dump()
 
+    @app.tool()
+    async def get_package_versions(packages: List[PackageQuery]) -> List[Dict[str, Any]]:
+        """Get the latest versions of several packages in one call.
+
+        The lookups run concurrently, so the call takes about as long as the
+        slowest registry rather than the sum of all of them.
+
+        Args:
+            packages: The packages to query, each with a package_manager (any name
+                      or alias accepted by get_package_version) and a package_name
+
+        Returns:
+            One dictionary per package, in request order: the package version
+            information, or the package_manager, package_name and error message
+            if that lookup failed
+
+        Examples:
+            - get_package_versions([{"package_manager": "npm", "package_name": "react"},
+                                    {"package_manager": "pypi", "package_name": "django"}])
+        """
+        results = await get_latest_versions(
+            [(package.package_manager, package.package_name) for package in packages]
+        )
+
+        response = []
+        for package, result in zip(packages, results):
+            if isinstance(result, BaseException):
+                response.append(
+                    {
+                        "package_manager": package.package_manager,
+                        "package_name": package.package_name,
+                        "error": f"{type(result).__name__}: {result}",
+                    }
+                )
+            else:
+                response.append(result.model_dump())
+        return response
+
     # Registry-specific tools
     @app.tool()
     async def get_npm_package(package_name: str) -> Dict[str, Any]: